@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+raw_path = "data/ks-projects-201801.csv"
+main_path = "data/ks_projects_main.parquet"
+with_cancelled_path = "data/ks_projects_with_cancelled.parquet"
+
+main_states = ["successful", "failed"]
+cancelled_state = "canceled"
+
+# raw columns we never use downstream
+COLS_TO_DROP = ["ID", "category", "currency", "goal", "pledged", "usd pledged"]
+
+
+def clean_kickstarter_data(df: pd.DataFrame) -> tuple:
+    df_clean = df.copy()
+
+    # parse the date columns, unparseable values become NaT and get dropped
+    # explicit format avoids the per-row dateutil fallback, cache=True parses
+    # every unique timestamp only once
+    df_clean["launched"] = pd.to_datetime(
+        df_clean["launched"], errors="coerce", cache=True, format="%Y-%m-%d %H:%M:%S"
+    )
+    df_clean["deadline"] = pd.to_datetime(
+        df_clean["deadline"], errors="coerce", cache=True, format="%Y-%m-%d"
+    )
+    df_clean = df_clean.dropna(subset=["launched", "deadline"])
+
+    # a handful of projects carry a placeholder 1970 launch date
+    df_clean = df_clean[df_clean["launched"].dt.year >= 2009]
+
+    # sort by launch date once here; parquet keeps the order, so downstream
+    # time-based features never have to sort again
+    df_clean = df_clean.sort_values("launched")
+
+    # Norway is encoded as 'N,0"' in the raw file; fix it on the ~22-entry
+    # category list instead of rewriting the whole object column ("NO" already
+    # exists, so the broken category is merged into it via the codes)
+    countries = df_clean["country"].cat.categories
+    if 'N,0"' in countries:
+        fixed = countries.where(countries != 'N,0"', "NO")
+        new_countries = fixed.unique()
+        code_map = new_countries.get_indexer(fixed)
+        df_clean["country"] = pd.Categorical.from_codes(
+            code_map[df_clean["country"].cat.codes.to_numpy()], categories=new_countries
+        )
+
+    # scan the state column once for both subsets and compute target before
+    # slicing, so each subset is just one boolean-mask copy
+    is_main = df_clean["state"].isin(main_states)
+    is_cancelled = df_clean["state"] == cancelled_state
+    df_clean["target"] = (df_clean["state"] == "successful").astype(np.int8)
+
+    # main set: only finished campaigns with a clear outcome; the second set
+    # keeps cancelled campaigns for the EDA on drop-outs
+    df_main = df_clean[is_main]
+    df_with_cancelled = df_clean[is_main | is_cancelled]
+
+    return df_main, df_with_cancelled
+
+
+if __name__ == "__main__":
+    # cleaning the raw kaggle file and storing both versions; guarded so that
+    # importing clean_kickstarter_data does not re-run the whole cleaning
+    df = pd.read_csv(
+        raw_path,
+        engine="pyarrow",
+        encoding="latin-1",
+        dtype={"main_category": "category", "country": "category", "state": "category"},
+    )
+    print(f"Raw data has {df.shape[0]} rows and {df.shape[1]} columns")
+
+    cols_set = set(df.columns)
+    existing_to_drop = [col for col in COLS_TO_DROP if col in cols_set]
+    df = df.drop(existing_to_drop, axis=1)
+
+    df_main, df_with_cancelled = clean_kickstarter_data(df)
+    print(f"Cleaned data has {df_main.shape[0]} rows ({df_with_cancelled.shape[0]} incl. cancelled)")
+
+    print("Saving cleaned data in the data folder")
+    df_main.to_parquet(main_path, engine="pyarrow", compression="snappy")
+    df_with_cancelled.to_parquet(with_cancelled_path, engine="pyarrow", compression="snappy")
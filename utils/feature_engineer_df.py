@@ -0,0 +1,343 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from clean_df import main_path
+
+input_path = main_path
+output_path = "data/ks_projects_features.parquet"
+
+# broader groups for the 15 kickstarter main categories
+category_map = {
+    "Film & Video": "Media",
+    "Music": "Media",
+    "Photography": "Media",
+    "Publishing": "Media",
+    "Journalism": "Media",
+    "Games": "Entertainment",
+    "Comics": "Entertainment",
+    "Theater": "Entertainment",
+    "Dance": "Entertainment",
+    "Art": "Creative",
+    "Design": "Creative",
+    "Fashion": "Creative",
+    "Crafts": "Creative",
+    "Technology": "Technology",
+}
+
+continent_map = {
+    "US": "North America",
+    "CA": "North America",
+    "MX": "North America",
+    "GB": "Europe",
+    "IE": "Europe",
+    "DE": "Europe",
+    "FR": "Europe",
+    "IT": "Europe",
+    "ES": "Europe",
+    "NL": "Europe",
+    "BE": "Europe",
+    "LU": "Europe",
+    "CH": "Europe",
+    "AT": "Europe",
+    "SE": "Europe",
+    "DK": "Europe",
+    "NO": "Europe",
+    "AU": "Oceania",
+    "NZ": "Oceania",
+    "JP": "Asia",
+    "HK": "Asia",
+    "SG": "Asia",
+}
+
+bin_labels = ["very_low", "low", "medium", "high", "very_high"]
+
+# season per month (index 0 unused), so month -> season is one array gather
+# instead of a python-level apply
+SEASONS = np.array(
+    ["", "Winter", "Winter", "Spring", "Spring", "Spring",
+     "Summer", "Summer", "Summer", "Fall", "Fall", "Fall", "Winter"],
+    dtype=object,
+)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _trending_kernel(sums: np.ndarray, counts: np.ndarray, lookback: int) -> np.ndarray:
+        # per week: success rate of every active category over the previous
+        # lookback weeks, flag the ones at or above the 75th percentile
+        n_weeks, n_cats = sums.shape
+        out = np.zeros((n_weeks, n_cats), dtype=np.bool_)
+        rates = np.empty(n_cats)
+        for w in range(n_weeks):
+            start = max(0, w - lookback)
+            n_active = 0
+            for c in range(n_cats):
+                s = 0.0
+                n = 0.0
+                for k in range(start, w):
+                    s += sums[k, c]
+                    n += counts[k, c]
+                if n > 0:
+                    rates[c] = s / n
+                    n_active += 1
+                else:
+                    rates[c] = np.nan
+            if n_active == 0:
+                continue
+            active = np.empty(n_active)
+            i = 0
+            for c in range(n_cats):
+                if not np.isnan(rates[c]):
+                    active[i] = rates[c]
+                    i += 1
+            threshold = np.quantile(active, 0.75)
+            for c in range(n_cats):
+                if not np.isnan(rates[c]) and rates[c] >= threshold:
+                    out[w, c] = True
+        return out
+
+
+def weekly_trending_table(df: pd.DataFrame, lookback_weeks: int = 4) -> pd.Series:
+    # bool per (launch week, category): was the category's success rate over
+    # the previous lookback_weeks in the top quartile? one successes/launches
+    # table per (week, category) instead of a python loop over every week
+    weeks = week_ids(df["launched"]).rename("launch_week_id")
+    weekly = df.groupby([weeks, df["main_category"]], observed=True)["target"].agg(["sum", "count"])
+    sums = weekly["sum"].unstack(fill_value=0)
+    counts = weekly["count"].unstack(fill_value=0)
+
+    # make the week axis gapless so the rolling window stays a calendar window
+    all_weeks = np.arange(sums.index.min(), sums.index.max() + 1)
+    sums = sums.reindex(all_weeks, fill_value=0)
+    counts = counts.reindex(all_weeks, fill_value=0)
+
+    # jit-compiled loop over the small weeks x categories matrices when numba
+    # is available, otherwise the equivalent rolling/quantile in pandas
+    if njit is not None:
+        flags = _trending_kernel(
+            sums.to_numpy(np.float64), counts.to_numpy(np.float64), lookback_weeks
+        )
+        return pd.DataFrame(flags, index=all_weeks, columns=sums.columns).stack()
+
+    # success rate over the previous lookback_weeks (shift keeps the current
+    # week out of its own window)
+    look_sum = sums.rolling(lookback_weeks, min_periods=1).sum().shift(1)
+    look_count = counts.rolling(lookback_weeks, min_periods=1).sum().shift(1)
+    success_rate = look_sum / look_count.replace(0, np.nan)
+
+    threshold = success_rate.quantile(0.75, axis=1)
+    return success_rate.ge(threshold, axis=0).stack()
+
+
+def identify_trending_categories(df: pd.DataFrame, lookback_weeks: int = 4) -> pd.DataFrame:
+    # the data is sorted by launch date once in clean_df.py, so no per-call
+    # sort_values plus full-frame copy here
+    assert df["launched"].is_monotonic_increasing, "expected data sorted by launch date"
+    df["launch_week_id"] = week_ids(df["launched"])
+
+    trending = weekly_trending_table(df, lookback_weeks)
+    row_index = pd.MultiIndex.from_frame(df[["launch_week_id", "main_category"]])
+    df["is_trending_category"] = (
+        trending.reindex(row_index).fillna(False).astype(int).to_numpy()
+    )
+
+    return df
+
+
+def map_categories(column: pd.Series, mapping: dict, default: str = "Other") -> pd.Series:
+    # remap on the small category list and gather with the int codes instead
+    # of a per-row dict lookup; the result stays categorical
+    cat = column.astype("category")
+    lookup = np.array([mapping.get(c, default) for c in cat.cat.categories], dtype=object)
+    return pd.Series(pd.Categorical(lookup[cat.cat.codes.to_numpy()]), index=column.index)
+
+
+def week_ids(launched: pd.Series) -> pd.Series:
+    # monotone int32 week id straight from the epoch offset; grouping on it
+    # is much cheaper than on an object-dtype PeriodIndex
+    return ((launched - pd.Timestamp(0)) // pd.Timedelta(weeks=1)).astype(np.int32)
+
+
+def quantile_bins(values: pd.Series, labels: list) -> pd.Categorical:
+    # equal-frequency bins via searchsorted against the precomputed quantile
+    # edges of the percentage rank, skipping the pd.qcut wrapper entirely
+    # (ranking with method="first" keeps ties spread over the bins)
+    edges = np.linspace(0, 1, num=len(labels) + 1)[1:-1]
+    ranks = values.rank(pct=True, method="first").to_numpy()
+    codes = np.searchsorted(edges, ranks, side="left").astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+def drop_columns(df: pd.DataFrame, cols_to_drop: list) -> pd.DataFrame:
+    # membership test against a set, not a linear scan of the Index
+    cols_set = set(df.columns)
+    existing = [c for c in cols_to_drop if c in cols_set]
+    return df.drop(existing, axis=1)
+
+
+def build_features(input_path: str, output_path: str) -> pd.DataFrame:
+    df = pd.read_parquet(input_path, engine="pyarrow")
+
+    # kickstarter amounts fit comfortably in 32 bits; halving the numeric
+    # columns halves the bytes every later groupby/rank pass has to scan
+    df["usd_goal_real"] = df["usd_goal_real"].astype(np.float32)
+    df["usd_pledged_real"] = df["usd_pledged_real"].astype(np.float32)
+    df["backers"] = df["backers"].astype(np.int32)
+
+    # zero-goal / zero-pledge campaigns are test entries; the boolean mask
+    # already yields a fresh frame, no extra .copy() needed
+    df = df.loc[(df["usd_goal_real"] > 0) & (df["usd_pledged_real"] > 0)]
+    df.reset_index(drop=True, inplace=True)
+
+    # work on the month arrays directly instead of materializing int64
+    # columns, and keep the seasons categorical for cheap groupby/one-hot
+    launched_months = df["launched"].dt.month.to_numpy()
+    deadline_months = df["deadline"].dt.month.to_numpy()
+
+    main_category_grouped = map_categories(df["main_category"], category_map)
+
+    # one groupby pass for both per-category means
+    means = df.groupby("main_category", sort=False, observed=True)[
+        ["usd_pledged_real", "usd_goal_real"]
+    ].transform("mean")
+
+    # where does the goal sit within its own category? percentage rank plus
+    # integer division bins without a per-group qcut callback
+    ranks = df.groupby(main_category_grouped, sort=False, observed=True)["usd_goal_real"].rank(
+        pct=True, method="first"
+    )
+    codes = np.clip((ranks.to_numpy() * 5).astype(np.int8), 0, 4)
+
+    # add all engineered columns in one assign instead of ~15 successive
+    # insertions, which keeps the frame from fragmenting
+    df = df.assign(
+        duration_days=(df["deadline"] - df["launched"]).dt.days.astype(np.int16),
+        launched_year=df["launched"].dt.year.astype(np.int16),
+        launched_month=launched_months.astype(np.int8),
+        deadline_month=deadline_months.astype(np.int8),
+        launch_season=pd.Categorical(SEASONS[launched_months]),
+        deadline_season=pd.Categorical(SEASONS[deadline_months]),
+        main_category_grouped=main_category_grouped,
+        continent=map_categories(df["country"], continent_map),
+        pledged_per_category=means["usd_pledged_real"].to_numpy(),
+        goal_per_category=means["usd_goal_real"].to_numpy(),
+        category_goal_percentile=pd.Categorical.from_codes(codes, categories=bin_labels),
+        usd_goal_bins=quantile_bins(df["usd_goal_real"], bin_labels),
+        usd_pledged_bins=quantile_bins(df["usd_pledged_real"], bin_labels),
+        backer_pledged_bins=quantile_bins(df["backers"], bin_labels),
+    )
+
+    df = identify_trending_categories(df)
+
+    df = drop_columns(df, ["name", "launched", "deadline", "state"])
+
+    df.to_parquet(output_path, engine="pyarrow", compression="snappy")
+    return df
+
+
+def build_features_chunked(input_path: str, output_path: str, batch_size: int = 100_000) -> None:
+    # streaming variant of build_features for dumps that do not fit in
+    # memory: the aggregates (category means, bin edges, trending table) come
+    # from one narrow pre-pass, then the row-wise features are applied batch
+    # by batch, so memory stays O(batch). the bins use value edges instead of
+    # ranks here, which can shift heavily tied rows into one bin
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(input_path)
+
+    pre = parquet_file.read(
+        columns=["launched", "main_category", "usd_goal_real", "usd_pledged_real", "backers", "target"]
+    ).to_pandas()
+    pre["usd_goal_real"] = pre["usd_goal_real"].astype(np.float32)
+    pre["usd_pledged_real"] = pre["usd_pledged_real"].astype(np.float32)
+    pre = pre.loc[(pre["usd_goal_real"] > 0) & (pre["usd_pledged_real"] > 0)]
+
+    cat_means = pre.groupby("main_category", sort=False, observed=True)[
+        ["usd_pledged_real", "usd_goal_real"]
+    ].mean()
+    quantiles = np.linspace(0, 1, num=len(bin_labels) + 1)[1:-1]
+    goal_edges = np.quantile(pre["usd_goal_real"].to_numpy(), quantiles)
+    pledged_edges = np.quantile(pre["usd_pledged_real"].to_numpy(), quantiles)
+    backer_edges = np.quantile(pre["backers"].to_numpy(), quantiles)
+    category_goal_edges = {
+        name: np.quantile(goals.to_numpy(), quantiles)
+        for name, goals in pre.groupby(
+            map_categories(pre["main_category"], category_map), observed=True
+        )["usd_goal_real"]
+    }
+    trending = weekly_trending_table(pre)
+
+    writer = None
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        chunk = batch.to_pandas()
+        chunk["usd_goal_real"] = chunk["usd_goal_real"].astype(np.float32)
+        chunk["usd_pledged_real"] = chunk["usd_pledged_real"].astype(np.float32)
+        chunk["backers"] = chunk["backers"].astype(np.int32)
+        chunk = chunk.loc[(chunk["usd_goal_real"] > 0) & (chunk["usd_pledged_real"] > 0)]
+        if chunk.empty:
+            continue
+        chunk.reset_index(drop=True, inplace=True)
+
+        launched_months = chunk["launched"].dt.month.to_numpy()
+        deadline_months = chunk["deadline"].dt.month.to_numpy()
+        main_category_grouped = map_categories(chunk["main_category"], category_map)
+
+        goals = chunk["usd_goal_real"].to_numpy()
+        category_goal_codes = np.zeros(len(chunk), dtype=np.int8)
+        for name, edges in category_goal_edges.items():
+            in_group = (main_category_grouped == name).to_numpy()
+            category_goal_codes[in_group] = np.searchsorted(edges, goals[in_group], side="left")
+
+        weeks = week_ids(chunk["launched"])
+        row_index = pd.MultiIndex.from_arrays([weeks, chunk["main_category"]])
+        categories = chunk["main_category"].to_numpy()
+
+        chunk = chunk.assign(
+            duration_days=(chunk["deadline"] - chunk["launched"]).dt.days.astype(np.int16),
+            launched_year=chunk["launched"].dt.year.astype(np.int16),
+            launched_month=launched_months.astype(np.int8),
+            deadline_month=deadline_months.astype(np.int8),
+            launch_season=pd.Categorical(SEASONS[launched_months]),
+            deadline_season=pd.Categorical(SEASONS[deadline_months]),
+            main_category_grouped=main_category_grouped,
+            continent=map_categories(chunk["country"], continent_map),
+            pledged_per_category=cat_means["usd_pledged_real"].reindex(categories).to_numpy(),
+            goal_per_category=cat_means["usd_goal_real"].reindex(categories).to_numpy(),
+            category_goal_percentile=pd.Categorical.from_codes(category_goal_codes, categories=bin_labels),
+            usd_goal_bins=pd.Categorical.from_codes(
+                np.searchsorted(goal_edges, goals, side="left").astype(np.int8), categories=bin_labels
+            ),
+            usd_pledged_bins=pd.Categorical.from_codes(
+                np.searchsorted(pledged_edges, chunk["usd_pledged_real"].to_numpy(), side="left").astype(np.int8),
+                categories=bin_labels,
+            ),
+            backer_pledged_bins=pd.Categorical.from_codes(
+                np.searchsorted(backer_edges, chunk["backers"].to_numpy(), side="left").astype(np.int8),
+                categories=bin_labels,
+            ),
+            launch_week_id=weeks,
+            is_trending_category=trending.reindex(row_index).fillna(False).astype(int).to_numpy(),
+        )
+        chunk = drop_columns(chunk, ["name", "launched", "deadline", "state"])
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(output_path, table.schema, compression="snappy")
+        writer.write_table(table)
+
+    if writer is not None:
+        writer.close()
+
+
+if __name__ == "__main__":
+    print("Building features")
+    df_features = build_features(input_path, output_path)
+    print(f"Engineered data has {df_features.shape[0]} rows and {df_features.shape[1]} columns")
+    print("Saving engineered data in the data folder")